@@ -12,15 +12,24 @@ The pipeline performs the following steps:
 5. Runs VTL validation scripts
 
 Dependencies:
+    - orjson
     - pandas
+    - pyarrow
     - pysdmx
     - vtlengine
 """
 
+import os
+from concurrent.futures import ThreadPoolExecutor
+from copy import copy
+from functools import lru_cache
 from pathlib import Path
-import json
 
+import orjson
 import pandas as pd
+import pyarrow as pa
+from pyarrow import compute as pc
+from pyarrow import csv as pa_csv
 from pysdmx.api.fmr import RegistryClient
 from pysdmx.io.format import StructureFormat
 from pysdmx.io.pd import PandasDataset
@@ -31,57 +40,312 @@ from vtlengine import run_sdmx
 from utils import validate_data_fmr
 
 
+# Mapping from the GLEIF golden copy columns to the LEI_DATA components.
+# Only these columns are parsed from the input file.
+RENAME_DICT = {
+    "LEI": "LEI",
+    "Entity.LegalName": "LEGAL_NAME",
+    "Entity.LegalAddress.Country": "COUNTRY_INCORPORATION",
+    "Entity.HeadquartersAddress.Country": "COUNTRY_HEADQUARTERS",
+    "Entity.EntityCategory": "CATEGORY",
+    "Entity.EntitySubCategory": "SUBCATEGORY",
+    "Entity.LegalForm.EntityLegalFormCode": "LEGAL_FORM",
+    "Entity.EntityStatus": "STATUS",
+    "Entity.LegalAddress.PostalCode": "POSTAL_CODE",
+}
+
+# Low-cardinality code columns, stored as pandas categoricals
+CATEGORICAL_COLUMNS = (
+    "COUNTRY_INCORPORATION",
+    "COUNTRY_HEADQUARTERS",
+    "CATEGORY",
+    "SUBCATEGORY",
+    "LEGAL_FORM",
+)
+
+# Column sets derived from RENAME_DICT, computed once and shared by every read and chunk
+_STATUS_COL = "Entity.EntityStatus"
+_KEEP_COLS = tuple(RENAME_DICT)
+_OUT_RENAME = tuple((old, new) for old, new in RENAME_DICT.items() if old != _STATUS_COL)
+_ACTIVE_KEEP_COLS = [old for old, _ in _OUT_RENAME]
+_CONVERT_OPTIONS = pa_csv.ConvertOptions(
+    include_columns=list(_KEEP_COLS),
+    column_types={column: pa.string() for column in _KEEP_COLS},
+    strings_can_be_null=True,
+)
+# Schemas of the streamed batches, used to build empty tables when no batch is read
+_SCHEMA = pa.schema([(column, pa.string()) for column in _KEEP_COLS])
+_ACTIVE_SCHEMA = pa.schema([(column, pa.string()) for column in _ACTIVE_KEEP_COLS])
+
+# Log files are written in the background; wait_for_logs() blocks until they are on disk
+_LOG_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="lei_sdmx_logs")
+_PENDING_LOGS = []
+
+
+def _check_logs_folder(logs_folder):
+    """
+    Raise at the call site if logs_folder does not exist, since the log files are written later.
+
+    Raises:
+        FileNotFoundError: If logs_folder is not an existing directory
+    """
+
+    if not Path(logs_folder).is_dir():
+        raise FileNotFoundError(f"Logs folder does not exist: {logs_folder}")
+
+
+def _write_log(func, *args, **kwargs):
+    """
+    Submit a log-writing call to the background executor.
+
+    Writes that already finished without error are dropped from the pending list, so it does
+    not grow in long-running processes; failed ones are kept for wait_for_logs() to raise.
+
+    Args:
+        func (callable): Function writing the log file
+        *args, **kwargs: Arguments passed to func
+    """
+
+    _PENDING_LOGS[:] = [future for future in _PENDING_LOGS
+                        if not future.done() or future.exception() is not None]
+    _PENDING_LOGS.append(_LOG_EXECUTOR.submit(func, *args, **kwargs))
+
+
+def _write_json(result, path):
+    """
+    Write a JSON-serializable result to path, indented with two spaces.
+    """
+
+    with open(path, "wb") as f:
+        f.write(orjson.dumps(result, option=orjson.OPT_INDENT_2))
+
+
+def _write_csv(data, path):
+    """
+    Write a DataFrame to a CSV file with the PyArrow CSV writer.
+
+    Object columns may hold mixed Python values Arrow cannot type, so they are written as strings.
+    """
+
+    data = data.astype({column: 'string' for column in data.select_dtypes(object)})
+    pa_csv.write_csv(pa.Table.from_pandas(data, preserve_index=False), path)
 
-def load_lei_data(input_path, row_limit=10000):
+
+def wait_for_logs():
+    """
+    Wait until all the log files submitted by the pipeline steps have been written.
+
+    Raises:
+        Exception: The first error raised while writing a log file
+    """
+
+    while _PENDING_LOGS:
+        _PENDING_LOGS.pop(0).result()
+
+
+def _to_pandas(table):
+    """
+    Convert a PyArrow table to pandas, keeping the strings in Arrow-backed (string[pyarrow]) columns.
+    """
+
+    return table.to_pandas(types_mapper={pa.string(): pd.StringDtype("pyarrow")}.get)
+
+
+def _iter_lei_batches(input_path, row_limit=10000, get_only_active=False):
+    """
+    Stream the RENAME_DICT columns of a LEI CSV file as PyArrow record batches.
+
+    Args:
+        input_path (str | Path | file-like): Path to the input CSV file containing LEI data,
+            or a binary file-like object (e.g. an open gzip file). Paths ending in a
+            compressed extension (such as .gz or .bz2) are decompressed on the fly.
+        row_limit (int, optional): Maximum number of rows to read. Defaults to 10000.
+            If None, the whole file is read.
+        get_only_active (bool, optional): Whether to keep only active entities. The filter is
+            applied on the Arrow batches, after row_limit, and the status column is dropped
+            once it has been used. Defaults to False.
+
+    Yields:
+        pyarrow.RecordBatch: Batches of string columns, never exceeding row_limit rows in total
+    """
+
+    remaining = row_limit
+    with pa_csv.open_csv(input_path, convert_options=_CONVERT_OPTIONS) as reader:
+        for batch in reader:
+            if remaining is not None:
+                if remaining <= 0:
+                    break
+                batch = batch.slice(0, remaining)
+                remaining -= batch.num_rows
+            if get_only_active:
+                batch = batch.filter(pc.equal(batch.column(_STATUS_COL), 'ACTIVE'))
+                batch = batch.select(_ACTIVE_KEEP_COLS)
+            yield batch
+
+
+def load_lei_data(input_path, row_limit=10000, get_only_active=False):
     """
     Load LEI data from a CSV file.
 
+    Only the columns in RENAME_DICT are parsed, using the PyArrow streaming CSV reader.
+
     Args:
-        input_path (str): Path to the input CSV file containing LEI data
+        input_path (str | Path | file-like): Path to the input CSV file containing LEI data,
+            or a binary file-like object (e.g. an open gzip file). Paths ending in a
+            compressed extension (such as .gz or .bz2) are decompressed on the fly.
         row_limit (int, optional): Maximum number of rows to read. Defaults to 10000.
+            If None, the whole file is read.
+        get_only_active (bool, optional): Whether to keep only active entities, filtering the
+            rows before they are converted to pandas. The status column is then not returned.
+            Defaults to False.
 
     Returns:
-        pandas.DataFrame: DataFrame containing the LEI data
+        pandas.DataFrame: DataFrame containing the LEI data, with string[pyarrow] columns
     """
 
-    data = pd.read_csv(input_path, dtype=str, nrows=row_limit)
+    batches = list(_iter_lei_batches(input_path, row_limit, get_only_active))
+    schema = _ACTIVE_SCHEMA if get_only_active else _SCHEMA
+    return _to_pandas(pa.Table.from_batches(batches, schema=schema))
+
+
+def iter_lei_data(input_path, row_limit=10000, chunksize=50_000, get_only_active=False):
+    """
+    Load LEI data from a CSV file in fixed-size chunks.
+
+    Args:
+        input_path (str | Path | file-like): Path to the input CSV file containing LEI data,
+            or a binary file-like object (see load_lei_data)
+        row_limit (int, optional): Maximum number of rows to read. Defaults to 10000.
+            If None, the whole file is read.
+        chunksize (int, optional): Number of rows per chunk. Defaults to 50000.
+        get_only_active (bool, optional): Whether to keep only active entities
+            (see load_lei_data). Defaults to False.
+
+    Yields:
+        pandas.DataFrame: DataFrames of chunksize rows (the last one may be shorter).
+            If no row is read, a single empty DataFrame with the read columns is yielded.
+    """
+
+    pending = []
+    pending_rows = 0
+    yielded = False
+    for batch in _iter_lei_batches(input_path, row_limit, get_only_active):
+        pending.append(batch)
+        pending_rows += batch.num_rows
+        while pending_rows >= chunksize:
+            table = pa.Table.from_batches(pending)
+            yield _to_pandas(table.slice(0, chunksize))
+            yielded = True
+            pending = table.slice(chunksize).to_batches()
+            pending_rows -= chunksize
+
+    if pending_rows or not yielded:
+        schema = _ACTIVE_SCHEMA if get_only_active else _SCHEMA
+        yield _to_pandas(pa.Table.from_batches(pending, schema=schema))
+
+def _to_categorical(data):
+    """
+    Cast the CATEGORICAL_COLUMNS of a reshaped DataFrame to category dtype, in place.
+    """
+
+    for column in CATEGORICAL_COLUMNS:
+        data[column] = data[column].astype('category')
 
-    return data
 
-def reshape_lei_data(data, get_only_active=True):
+def reshape_lei_data(data, get_only_active=True, categorical=True):
     """
     Reshape and clean LEI data by renaming columns and filtering active entities.
 
     Args:
         data (pandas.DataFrame): Input DataFrame containing LEI data
         get_only_active (bool, optional): Whether to filter only active entities. Defaults to True.
+            Data without the status column is taken as already filtered (see load_lei_data).
+        categorical (bool, optional): Whether to cast the CATEGORICAL_COLUMNS to category dtype.
+            Defaults to True.
 
     Returns:
-        pandas.DataFrame: Cleaned and reshaped DataFrame with standardized column names
-    """
-
-    RENAME_DICT = {
-        "LEI": "LEI",
-        "Entity.LegalName": "LEGAL_NAME",
-        "Entity.LegalAddress.Country": "COUNTRY_INCORPORATION",
-        "Entity.HeadquartersAddress.Country": "COUNTRY_HEADQUARTERS",
-        "Entity.EntityCategory": "CATEGORY",
-        "Entity.EntitySubCategory": "SUBCATEGORY",
-        "Entity.LegalForm.EntityLegalFormCode": "LEGAL_FORM",
-        "Entity.EntityStatus": "STATUS",
-        "Entity.LegalAddress.PostalCode": "POSTAL_CODE",
-    }
+        pandas.DataFrame: Cleaned and reshaped DataFrame with standardized column names.
+            With categorical, the CATEGORICAL_COLUMNS are returned with category dtype.
+    """
 
-    data.rename(columns=RENAME_DICT, inplace=True)
-    data = data[list(RENAME_DICT.values())]
+    # Build the renamed frame straight from the column arrays (no rename + reselection copies).
+    # STATUS is only used for filtering, so it never reaches the output frame.
+    columns = {new: data[old].array for old, new in _OUT_RENAME}
 
-    if get_only_active:
-        data = data[data['STATUS'] == 'ACTIVE'].reset_index(drop=True)
-    del data['STATUS']
+    if get_only_active and _STATUS_COL in data:
+        mask = (data[_STATUS_COL] == 'ACTIVE').to_numpy(dtype=bool, na_value=False)
+        columns = {column: values[mask] for column, values in columns.items()}
+
+    data = pd.DataFrame(columns, copy=False)
+    if categorical:
+        _to_categorical(data)
 
     return data
 
-def get_sdmx_dataset(data, sdmx_api_endpoint="https://fmr.meaningfuldata.eu/sdmx/v2", output_path=None):
+@lru_cache(maxsize=None)
+def _get_registry_client(sdmx_api_endpoint, fmt=StructureFormat.FUSION_JSON):
+    """
+    Get the RegistryClient for an endpoint and format, creating it only once per process.
+
+    Args:
+        sdmx_api_endpoint (str): SDMX API endpoint URL
+        fmt (StructureFormat, optional): Format of the structures returned by the registry.
+            Defaults to StructureFormat.FUSION_JSON.
+
+    Returns:
+        RegistryClient: The shared client
+    """
+
+    return RegistryClient(sdmx_api_endpoint, format=fmt)
+
+@lru_cache(maxsize=32)
+def get_lei_schema(sdmx_api_endpoint="https://fmr.meaningfuldata.eu/sdmx/v2", agency="MD", id="LEI_DATA",
+                   version="1.0"):
+    """
+    Retrieve the schema of the LEI data structure from the registry.
+
+    Structures are immutable for a given (agency, id, version), so results are cached per process.
+
+    Args:
+        sdmx_api_endpoint (str, optional): SDMX API endpoint URL. 
+            Defaults to "https://fmr.meaningfuldata.eu/sdmx/v2".
+        agency (str, optional): Agency of the data structure. Defaults to "MD".
+        id (str, optional): Identifier of the data structure. Defaults to "LEI_DATA".
+        version (str, optional): Version of the data structure. Defaults to "1.0".
+
+    Returns:
+        Schema: Schema of the data structure
+    """
+
+    client = _get_registry_client(sdmx_api_endpoint)
+    return client.get_schema(
+        "datastructure", agency=agency, id=id, version=version
+    )
+
+@lru_cache(maxsize=32)
+def get_vtl_transformation_scheme(api_endpoint, agency, id, version):
+    """
+    Retrieve a VTL transformation scheme from the registry.
+
+    Transformation schemes are immutable for a given (agency, id, version), so results are cached
+    per process.
+
+    Args:
+        api_endpoint (str): SDMX API endpoint URL
+        agency (str): Agency of the transformation scheme
+        id (str): Identifier of the transformation scheme
+        version (str): Version of the transformation scheme
+
+    Returns:
+        TransformationScheme: The VTL transformation scheme
+    """
+
+    rc = _get_registry_client(api_endpoint, StructureFormat.SDMX_JSON_2_0_0)
+
+    return rc.get_vtl_transformation_scheme(id=id, agency=agency, version=version)
+
+def get_sdmx_dataset(data, sdmx_api_endpoint="https://fmr.meaningfuldata.eu/sdmx/v2", output_path=None,
+                     schema=None):
     """
     Convert pandas DataFrame to SDMX dataset format.
 
@@ -89,46 +353,62 @@ def get_sdmx_dataset(data, sdmx_api_endpoint="https://fmr.meaningfuldata.eu/sdmx
         data (pandas.DataFrame): Input DataFrame containing LEI data
         sdmx_api_endpoint (str, optional): SDMX API endpoint URL. 
             Defaults to "https://fmr.meaningfuldata.eu/sdmx/v2".
+        output_path (str, optional): Path to save the SDMX-CSV 2.0 output. If None, no file is saved.
+        schema (Schema, optional): Schema of the LEI_DATA data structure.
+            If None, it is retrieved from sdmx_api_endpoint.
 
     Returns:
-        PandasDataset: SDMX-formatted dataset
+        tuple: (dataset, csv_text)
+            - dataset: SDMX-formatted dataset (PandasDataset)
+            - csv_text: The dataset serialized as SDMX-CSV 2.0
     """
 
-    client = RegistryClient(
-        sdmx_api_endpoint, format=StructureFormat.FUSION_JSON
-    )
-    schema = client.get_schema(
-        "datastructure", agency="MD", id="LEI_DATA", version="1.0"
-    )
+    if schema is None:
+        schema = get_lei_schema(sdmx_api_endpoint)
     # Generate the PandasDataset
     dataset = PandasDataset(structure=schema, data=data)
 
+    # Serialization on SDMX-CSV 2.0
+    csv_text = write_csv_20([dataset])
+
     if output_path:
-        write_csv_20([dataset], output_path)
+        with open(output_path, "wb") as f:
+            f.write(csv_text.encode("utf-8"))
 
-    return dataset
+    return dataset, csv_text
 
 
-def structural_validation(dataset, logs_folder=None):
+def structural_validation(dataset, logs_folder=None, csv_bytes=None):
     """
     Perform structural validation of the SDMX dataset using FMR (Fusion Metadata Registry).
 
     Args:
         dataset (PandasDataset): SDMX dataset to validate
+        logs_folder (Path, optional): Folder where the validation result is saved as JSON.
+            The file is written in the background and may not exist yet when this function
+            returns; call wait_for_logs() before reading it. If None, no log is saved.
+        csv_bytes (bytes, optional): The dataset already serialized as UTF-8 encoded SDMX-CSV 2.0.
+            If None, the dataset is serialized here.
 
     Returns:
         dict: Validation results from FMR
+
+    Raises:
+        FileNotFoundError: If logs_folder is given but does not exist
     """
-    # Serialization on SDMX-CSV 2.0
-    csv_text = write_csv_20([dataset])
+    if logs_folder:
+        _check_logs_folder(logs_folder)
+
+    # Serialization on SDMX-CSV 2.0, encoded once for the upload
+    if csv_bytes is None:
+        csv_bytes = write_csv_20([dataset]).encode("utf-8")
 
     # Validate using FMR
-    result = validate_data_fmr(csv_text, host="fmr.meaningfuldata.eu", port=443,
+    result = validate_data_fmr(csv_bytes, host="fmr.meaningfuldata.eu", port=443,
                             use_https=True)
     
     if logs_folder:
-        with open(logs_folder / "structural_validation_logs.json", "w") as f:
-            json.dump(result, f)
+        _write_log(_write_json, result, logs_folder / "structural_validation_logs.json")
 
     return result
 
@@ -144,22 +424,34 @@ def run_vtl_script(vtl_script_query, datasets, logs_folder=None):
             - version: Script version
             - api_endpoint: API endpoint URL
         datasets: SDMX dataset(s) to validate
+        logs_folder (Path, optional): Folder where each VTL result is saved as CSV. The files
+            are written in the background, so they may be missing when this function returns
+            until wait_for_logs() is called. If None, no log is saved.
 
     Returns:
         dict: Results of the VTL validation
+
+    Raises:
+        FileNotFoundError: If logs_folder is given but does not exist
     """
 
-    rc = RegistryClient(api_endpoint=vtl_script_query['api_endpoint'])
+    if logs_folder:
+        _check_logs_folder(logs_folder)
 
-    vtl_transformation_scheme = rc.get_vtl_transformation_scheme(
-        id=vtl_script_query['id'],
+    vtl_transformation_scheme = get_vtl_transformation_scheme(
+        vtl_script_query['api_endpoint'],
         agency=vtl_script_query['agency'],
+        id=vtl_script_query['id'],
         version=vtl_script_query['version'])
-    result = run_sdmx(vtl_transformation_scheme, [datasets], return_only_persistent=True)
+    # vtlengine does not detect nulls in categorical columns, so it gets them as plain strings
+    vtl_dataset = copy(datasets)
+    vtl_dataset.data = datasets.data.astype(
+        {column: object for column in datasets.data.select_dtypes('category')})
+    result = run_sdmx(vtl_transformation_scheme, [vtl_dataset], return_only_persistent=True)
 
     if logs_folder:
         for key, value in result.items():
-            value.data.to_csv(logs_folder / f"{key}_logs.csv", index=False)
+            _write_log(_write_csv, value.data, logs_folder / f"{key}_logs.csv")
 
     return result
 
@@ -170,32 +462,93 @@ def lei_to_sdmx_pipeline(
         sdmx_api_endpoint="https://fmr.meaningfuldata.eu/sdmx/v2", 
         vtl_script_query=None,
         output_path=None,
-        logs_folder=None
+        logs_folder=None,
+        chunksize=50_000
         ):
     """
     Main pipeline function that orchestrates the entire LEI to SDMX transformation process.
 
+    The input is processed in chunks of chunksize rows: each chunk is reshaped and, if
+    output_path is set, appended to the SDMX-CSV output as soon as it is ready. Only this
+    write is streamed: the validations need the whole dataset and its SDMX-CSV text, so
+    both are held in memory until the pipeline returns. The output is written to a
+    temporary file next to output_path and only moved into place once every chunk is
+    written, so a failure never leaves a truncated file behind.
+
     Args:
-        input_path (str): Path to the input CSV file containing LEI data
+        input_path (str | Path | file-like): Path to the input CSV file containing LEI data,
+            or a binary file-like object (e.g. an open gzip file). Paths ending in a
+            compressed extension (such as .gz or .bz2) are decompressed on the fly.
         row_limit (int, optional): Maximum number of rows to process. Defaults to 10000.
         sdmx_api_endpoint (str, optional): SDMX API endpoint URL. 
             Defaults to "https://fmr.meaningfuldata.eu/sdmx/v2".
         vtl_script_query (dict, optional): VTL script parameters for validation. 
             If None, VTL validation is skipped.
         output_path (str, optional): Path to save the output. If None, no file is saved.
+        logs_folder (Path, optional): Folder for the validation logs. They are written in the
+            background by both validation steps; use wait_for_logs() to make sure they are on
+            disk. If None, no logs are saved.
+        chunksize (int, optional): Number of input rows processed at a time. Defaults to 50000.
 
     Returns:
         tuple: (dataset, structural_validation_result, validation_result)
             - dataset: The SDMX-formatted dataset
             - structural_validation_result: Results of structural validation
             - validation_result: Results of VTL validation (if performed)
+
+    Raises:
+        FileNotFoundError: If logs_folder is given but does not exist
     """
 
-    data = load_lei_data(input_path, row_limit)
-    data = reshape_lei_data(data)
-    dataset = get_sdmx_dataset(data, sdmx_api_endpoint, output_path)
-    structural_validation_result = structural_validation(dataset, logs_folder)
-    validation_result = run_vtl_script(vtl_script_query, dataset, logs_folder)
+    if logs_folder:
+        _check_logs_folder(logs_folder)
+
+    schema = get_lei_schema(sdmx_api_endpoint)
+
+    chunks = []
+    csv_fragments = []
+    output_file = None
+    if output_path:
+        tmp_path = Path(output_path).with_name(f"{Path(output_path).name}.tmp")
+        output_file = open(tmp_path, "wb")
+    try:
+        # Inactive entities are dropped while reading, so reshaping does not filter again
+        for chunk in iter_lei_data(input_path, row_limit, chunksize, get_only_active=True):
+            # The categoricals are built once, on the concatenated frame
+            chunk = reshape_lei_data(chunk, get_only_active=False, categorical=False)
+            chunks.append(chunk)
+
+            csv_fragment = write_csv_20([PandasDataset(structure=schema, data=chunk)])
+            # Only the first fragment keeps the SDMX-CSV header
+            if csv_fragments:
+                csv_fragment = csv_fragment.partition("\n")[2]
+            csv_fragment = csv_fragment.encode("utf-8")
+            csv_fragments.append(csv_fragment)
+
+            if output_file:
+                output_file.write(csv_fragment)
+    except BaseException:
+        if output_file:
+            output_file.close()
+            os.unlink(tmp_path)
+        raise
+    if output_file:
+        output_file.close()
+        os.replace(tmp_path, output_path)
+
+    data = pd.concat(chunks, ignore_index=True)
+    del chunks
+    _to_categorical(data)
+    dataset = PandasDataset(structure=schema, data=data)
+    csv_bytes = b"".join(csv_fragments)
+    del csv_fragments
+
+    # Both validations only read the dataset and mostly wait on FMR, so they run concurrently
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        structural_future = executor.submit(structural_validation, dataset, logs_folder, csv_bytes=csv_bytes)
+        vtl_future = executor.submit(run_vtl_script, vtl_script_query, dataset, logs_folder)
+        structural_validation_result = structural_future.result()
+        validation_result = vtl_future.result()
     return dataset, structural_validation_result, validation_result
 
 
@@ -223,6 +576,8 @@ if __name__ == "__main__":
         logs_folder=LOGS_FOLDER
         )
     
+    wait_for_logs()
+
     print(f"Process finished. SDMX dataset saved to {OUTPUT_PATH}")
     print(f"Logs saved to {LOGS_FOLDER}")
     print(validation_result.keys())
@@ -2,11 +2,12 @@
 Utility functions for SDMX data validation using FMR (Fusion Metadata Registry).
 """
 
-import json
-from time import sleep, time
-from typing import Any, Dict, List, Optional
+from time import sleep
+from typing import Any, Dict, List, Optional, Union
 
-from requests import get, post
+import orjson
+from requests import Session
+from requests.adapters import HTTPAdapter
 
 # ------------------------------
 # ------------ FMR -------------
@@ -21,24 +22,35 @@ STATUS_ERRORS = ['IncorrectDSD', 'InvalidRef', 'MissingDSD',
 
 STATUS_COMPLETED = ["Complete"]
 
+# Shared session for all the FMR requests, keeping connections alive
+# between the upload and the status polls (and across validations)
+_SESSION = Session()
+_ADAPTER = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+_SESSION.mount('http://', _ADAPTER)
+_SESSION.mount('https://', _ADAPTER)
 
-def __handle_status(response_status):
-    if response_status.json()['Status'] == 'Complete':
-        if response_status.json()['Datasets'][0]['Errors']:
-            return response_status.json()['Datasets'][0]['ValidationReport']
+
+def __handle_status(status_body: dict):
+    if status_body['Status'] == 'Complete':
+        if status_body['Datasets'][0]['Errors']:
+            return status_body['Datasets'][0]['ValidationReport']
         else:
             return []
-    if response_status.json()['Status'] in STATUS_ERRORS:
-        raise Exception(response_status.json())
+    if status_body['Status'] in STATUS_ERRORS:
+        raise Exception(status_body)
 
 
 def __validation_status_request(status_url: str,
                                 uid: str,
                                 max_retries: int = 10,
-                                interval_time: float = 0.5):
+                                interval_time: float = 0.5,
+                                session: Session = _SESSION):
     """
     Polls the FMR instance to get the validation status of an uploaded file
 
+    The wait between polls grows exponentially, starting at interval_time
+    and multiplied by 1.5 after each poll.
+
     :param status_url: The URL for checking the validation status
     :type status_url: str
 
@@ -49,65 +61,42 @@ def __validation_status_request(status_url: str,
                         checking validation status
     :type max_retries: int
 
-    :param interval_time: The interval time between retries in seconds
+    :param interval_time: The initial interval time between retries
+                          in seconds
     :type interval_time: float
 
+    :param session: The session used for the requests, so the connection
+                    is reused between polls (default is the module session)
+    :type session: requests.Session
+
     :return: The validation status if successful
 
     :exception: raise an exception if the validation status
                 is not found in the response
-    :exception: raise an exception if the current time exceeds the timeout
+    :exception: raise an exception if the maximum number of retries
+                is exceeded
     """
 
-    # Record the starting time for the entire validation process
-    start_global = time()
-
-    # Initialize variables for tracking time intervals
-    start = time()
-    interval_counter = 0
-
-    # Get the current time
-    current = time()
-
-    # Calculate the total timeout based on max retries and interval time
-    timeout = max_retries * interval_time
-
-    while current - start_global < timeout:
-        current = time()
-
-        # Calculate the time interval from the start of the validation process
-        interval_start = current - start_global
-        interval = current - start
-
-        # Skip the current iteration if the time interval is less than the
-        # specified interval time
-        if interval_start <= interval_time:
-            continue
+    for attempt in range(max_retries):
+        # Back off before each poll
+        sleep(interval_time * (1.5 ** attempt))
 
         # Perform a get request to the server to check the load status
-        response_status = get(url=status_url,
-                              params={'uid': uid})
+        response_status = session.get(url=status_url,
+                                      params={'uid': uid})
+        # Parsing the response body only once
+        status_body = orjson.loads(response_status.content)
 
         # Check if the 'Status' key is present in the response JSON
-        if 'Status' not in response_status.json():
+        if 'Status' not in status_body:
             raise Exception("Error: Status not found in response")
 
-        # Check if the status is still in process
-        if response_status.json()['Status'] in STATUS_IN_PROCESS:
-            if interval > interval_time:
-                interval_counter += 1
-                start = time()
-
-            # Check if the maximum number of retries is reached
-            if interval_counter == max_retries:
-                raise Exception(
-                    f"Error: Max retries exceeded ({interval_counter})")
+        # Return the handled status once the validation is not in process
+        if status_body['Status'] not in STATUS_IN_PROCESS:
+            return __handle_status(status_body)
 
-        # Return the handled status if the validation is still in process
-        return __handle_status(response_status)
-
-    # Raise an exception if the total timeout is exceeded
-    raise Exception(f"Timeout {timeout} exceeded on status request.")
+    # Raise an exception if the maximum number of retries is reached
+    raise Exception(f"Error: Max retries exceeded ({max_retries})")
 
 
 def get_validation_status(status_url: str,
@@ -135,28 +124,32 @@ def get_validation_status(status_url: str,
     :return: The validation status if successful
     :exception: raise an exception if the validation status
                 is not found in the response
-    :exception: raise an exception if the current time exceeds the timeout
+    :exception: raise an exception if the maximum number of retries
+                is exceeded
     """
 
     # Pause execution for the specified interval time
     sleep(interval_time)
 
     # Perform a GET request to the server to check the load status
-    response_status = get(url=status_url,
-                          params={'uid': uid})
+    response_status = _SESSION.get(url=status_url,
+                                   params={'uid': uid})
+    # Parsing the response body only once
+    status_body = orjson.loads(response_status.content)
 
     # Check if the status is still in process
-    if response_status.json()['Status'] in STATUS_IN_PROCESS:
-        # If in process, recursively call the function with retries
+    if status_body['Status'] in STATUS_IN_PROCESS:
+        # If in process, keep polling with retries
         return __validation_status_request(status_url=status_url,
                                            uid=uid,
                                            max_retries=max_retries,
-                                           interval_time=interval_time)
+                                           interval_time=interval_time,
+                                           session=_SESSION)
     # Return the handled status if the validation is complete
-    return __handle_status(response_status)
+    return __handle_status(status_body)
 
 
-def validate_data_fmr(csv_text: str,
+def validate_data_fmr(csv_text: Union[str, bytes],
                       host: str = 'localhost',
                       port: int = 8080,
                       use_https: bool = False,
@@ -168,8 +161,9 @@ def validate_data_fmr(csv_text: str,
     Validates an SDMX CSV file by uploading it to an FMR instance
     and checking its validation status
 
-    :param csv_text: The SDMX CSV text to be validated
-    :type csv_text: str
+    :param csv_text: The SDMX CSV data to be validated, preferably as
+                     UTF-8 encoded bytes (text is encoded here)
+    :type csv_text: Union[str, bytes]
 
     :param host: The FMR instance host (default is 'localhost')
     :type host: str
@@ -213,10 +207,20 @@ def validate_data_fmr(csv_text: str,
     # Defining headers for the request
     headers = {'Data-Format': f'csv;delimiter={delimiter}'}
 
+    # Encoding the CSV data once (callers should already pass bytes),
+    # the upload is sent as bytes
+    payload = csv_text.encode('utf-8') if isinstance(csv_text, str) else csv_text
+
+    # Older SDMX-CSV writers label the structure as dataprovision. The
+    # membership test avoids building a patched copy when there is nothing
+    # to replace (current pysdmx writers already emit datastructure)
+    if b'dataprovision' in payload:
+        payload = payload.replace(b'dataprovision', b'datastructure')
+
     # Perform a POST request to the server with the CSV data as an attachment
-    response = post(upload_url,
-                    files={'uploadFile': csv_text.replace("dataprovision", "datastructure")},
-                    headers=headers)
+    response = _SESSION.post(upload_url,
+                             files={'uploadFile': ('data.csv', payload, 'text/csv')},
+                             headers=headers)
 
     # Check the response from the server
     if not response.status_code == 200:
@@ -226,7 +230,7 @@ def validate_data_fmr(csv_text: str,
     status_url = base_url + '/ws/public/data/loadStatus'
 
     # Getting the uid from the request response
-    uid = response.json()['uid']
+    uid = orjson.loads(response.content)['uid']
 
     # Return the validation status by calling a separate function
     return get_validation_status(status_url=status_url,